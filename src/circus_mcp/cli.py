@@ -3,11 +3,24 @@ Simple CLI for Circus process management.
 """
 
 import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
 
 import click
 
 from .manager import CircusManager
 
+T = TypeVar("T")
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, using uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
 
 @click.group()
 def cli():
@@ -24,25 +37,25 @@ def add(name: str, command: str, numprocesses: int, working_dir: str):
     """Add a new process."""
 
     async def _add():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
 
-        kwargs = {"numprocesses": numprocesses}
-        if working_dir:
-            kwargs["working_dir"] = working_dir
+            kwargs = {"numprocesses": numprocesses}
+            if working_dir:
+                kwargs["working_dir"] = working_dir
 
-        try:
-            result = await manager.add_process(name, command, **kwargs)
-            if result.get("status") == "ok":
-                click.echo(f"Process '{name}' added successfully")
-            else:
-                click.echo(f"Failed to add process: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+            try:
+                result = await manager.add_process(name, command, **kwargs)
+                if result.get("status") == "ok":
+                    click.echo(f"Process '{name}' added successfully")
+                else:
+                    click.echo(f"Failed to add process: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_add())
+    _run(_add())
 
 
 @cli.command()
@@ -51,21 +64,21 @@ def start(name: str):
     """Start a process."""
 
     async def _start():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
 
-        try:
-            result = await manager.start_process(name)
-            if result.get("status") == "ok":
-                click.echo(f"Process '{name}' started")
-            else:
-                click.echo(f"Failed to start process: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+            try:
+                result = await manager.start_process(name)
+                if result.get("status") == "ok":
+                    click.echo(f"Process '{name}' started")
+                else:
+                    click.echo(f"Failed to start process: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_start())
+    _run(_start())
 
 
 @cli.command()
@@ -74,21 +87,21 @@ def stop(name: str):
     """Stop a process."""
 
     async def _stop():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
 
-        try:
-            result = await manager.stop_process(name)
-            if result.get("status") == "ok":
-                click.echo(f"Process '{name}' stopped")
-            else:
-                click.echo(f"Failed to stop process: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+            try:
+                result = await manager.stop_process(name)
+                if result.get("status") == "ok":
+                    click.echo(f"Process '{name}' stopped")
+                else:
+                    click.echo(f"Failed to stop process: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_stop())
+    _run(_stop())
 
 
 @cli.command()
@@ -96,27 +109,27 @@ def list():
     """List all processes."""
 
     async def _list():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
-
-        try:
-            result = await manager.list_processes()
-            if result.get("status") == "ok":
-                watchers = result.get("watchers", [])
-                if watchers:
-                    click.echo("Processes:")
-                    for watcher in watchers:
-                        click.echo(f"  - {watcher}")
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
+
+            try:
+                result = await manager.list_processes()
+                if result.get("status") == "ok":
+                    watchers = result.get("watchers", [])
+                    if watchers:
+                        click.echo("Processes:")
+                        for watcher in watchers:
+                            click.echo(f"  - {watcher}")
+                    else:
+                        click.echo("No processes found")
                 else:
-                    click.echo("No processes found")
-            else:
-                click.echo(f"Failed to list processes: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+                    click.echo(f"Failed to list processes: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_list())
+    _run(_list())
 
 
 @cli.command()
@@ -125,21 +138,21 @@ def status(name: str):
     """Get process status."""
 
     async def _status():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
 
-        try:
-            result = await manager.get_process_status(name)
-            if result.get("status") == "ok":
-                click.echo(f"Process '{name}' status: {result.get('status')}")
-            else:
-                click.echo(f"Failed to get status: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+            try:
+                result = await manager.get_process_status(name)
+                if result.get("status") == "ok":
+                    click.echo(f"Process '{name}' status: {result.get('status')}")
+                else:
+                    click.echo(f"Failed to get status: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_status())
+    _run(_status())
 
 
 @cli.command()
@@ -148,21 +161,21 @@ def restart(name: str):
     """Restart a process."""
 
     async def _restart():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
 
-        try:
-            result = await manager.restart_process(name)
-            if result.get("status") == "ok":
-                click.echo(f"Process '{name}' restarted")
-            else:
-                click.echo(f"Failed to restart process: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+            try:
+                result = await manager.restart_process(name)
+                if result.get("status") == "ok":
+                    click.echo(f"Process '{name}' restarted")
+                else:
+                    click.echo(f"Failed to restart process: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_restart())
+    _run(_restart())
 
 
 @cli.command()
@@ -171,21 +184,21 @@ def remove(name: str):
     """Remove a process."""
 
     async def _remove():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
 
-        try:
-            result = await manager.remove_process(name)
-            if result.get("status") == "ok":
-                click.echo(f"Process '{name}' removed")
-            else:
-                click.echo(f"Failed to remove process: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+            try:
+                result = await manager.remove_process(name)
+                if result.get("status") == "ok":
+                    click.echo(f"Process '{name}' removed")
+                else:
+                    click.echo(f"Failed to remove process: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_remove())
+    _run(_remove())
 
 
 @cli.command()
@@ -198,7 +211,7 @@ def start_daemon(config: str):
         click.echo("Circus daemon is already running")
         return
 
-    if manager.start_daemon(config):
+    if manager.start_daemon(config, check_running=False):
         click.echo(f"Circus daemon started with config: {config}")
     else:
         click.echo("Failed to start Circus daemon")
@@ -236,28 +249,28 @@ def ensure_started(name: str):
     """Ensure process is in started state (idempotent start)."""
 
     async def _ensure_started():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
-
-        try:
-            if name.lower() == "all":
-                result = await manager.start_all()
-                if result.get("status") == "ok":
-                    click.echo("All processes ensured started")
-                else:
-                    click.echo(f"Failed to start all processes: {result}")
-            else:
-                result = await manager.ensure_started(name)
-                if result.get("status") == "ok":
-                    click.echo(result.get("message", f"Process '{name}' ensured started"))
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
+
+            try:
+                if name.lower() == "all":
+                    result = await manager.start_all()
+                    if result.get("status") == "ok":
+                        click.echo("All processes ensured started")
+                    else:
+                        click.echo(f"Failed to start all processes: {result}")
                 else:
-                    click.echo(f"Failed to ensure process started: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+                    result = await manager.ensure_started(name)
+                    if result.get("status") == "ok":
+                        click.echo(result.get("message", f"Process '{name}' ensured started"))
+                    else:
+                        click.echo(f"Failed to ensure process started: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_ensure_started())
+    _run(_ensure_started())
 
 
 @cli.command()
@@ -266,28 +279,28 @@ def ensure_stopped(name: str):
     """Ensure process is in stopped state (idempotent stop)."""
 
     async def _ensure_stopped():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
-
-        try:
-            if name.lower() == "all":
-                result = await manager.stop_all()
-                if result.get("status") == "ok":
-                    click.echo("All processes ensured stopped")
-                else:
-                    click.echo(f"Failed to stop all processes: {result}")
-            else:
-                result = await manager.ensure_stopped(name)
-                if result.get("status") == "ok":
-                    click.echo(result.get("message", f"Process '{name}' ensured stopped"))
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
+
+            try:
+                if name.lower() == "all":
+                    result = await manager.stop_all()
+                    if result.get("status") == "ok":
+                        click.echo("All processes ensured stopped")
+                    else:
+                        click.echo(f"Failed to stop all processes: {result}")
                 else:
-                    click.echo(f"Failed to ensure process stopped: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+                    result = await manager.ensure_stopped(name)
+                    if result.get("status") == "ok":
+                        click.echo(result.get("message", f"Process '{name}' ensured stopped"))
+                    else:
+                        click.echo(f"Failed to ensure process stopped: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_ensure_stopped())
+    _run(_ensure_stopped())
 
 
 @cli.command()
@@ -296,28 +309,28 @@ def start_all(name: str):
     """Start all processes or specific process with 'all' support."""
 
     async def _start_all():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
-
-        try:
-            if name.lower() == "all":
-                result = await manager.start_all()
-                if result.get("status") == "ok":
-                    click.echo("All processes started")
-                else:
-                    click.echo(f"Failed to start all processes: {result}")
-            else:
-                result = await manager.start_process(name)
-                if result.get("status") == "ok":
-                    click.echo(f"Process '{name}' started")
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
+
+            try:
+                if name.lower() == "all":
+                    result = await manager.start_all()
+                    if result.get("status") == "ok":
+                        click.echo("All processes started")
+                    else:
+                        click.echo(f"Failed to start all processes: {result}")
                 else:
-                    click.echo(f"Failed to start process: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+                    result = await manager.start_process(name)
+                    if result.get("status") == "ok":
+                        click.echo(f"Process '{name}' started")
+                    else:
+                        click.echo(f"Failed to start process: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_start_all())
+    _run(_start_all())
 
 
 @cli.command()
@@ -326,28 +339,28 @@ def stop_all(name: str):
     """Stop all processes or specific process with 'all' support."""
 
     async def _stop_all():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
-
-        try:
-            if name.lower() == "all":
-                result = await manager.stop_all()
-                if result.get("status") == "ok":
-                    click.echo("All processes stopped")
-                else:
-                    click.echo(f"Failed to stop all processes: {result}")
-            else:
-                result = await manager.stop_process(name)
-                if result.get("status") == "ok":
-                    click.echo(f"Process '{name}' stopped")
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
+
+            try:
+                if name.lower() == "all":
+                    result = await manager.stop_all()
+                    if result.get("status") == "ok":
+                        click.echo("All processes stopped")
+                    else:
+                        click.echo(f"Failed to stop all processes: {result}")
                 else:
-                    click.echo(f"Failed to stop process: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+                    result = await manager.stop_process(name)
+                    if result.get("status") == "ok":
+                        click.echo(f"Process '{name}' stopped")
+                    else:
+                        click.echo(f"Failed to stop process: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_stop_all())
+    _run(_stop_all())
 
 
 @cli.command()
@@ -356,28 +369,28 @@ def restart_all(name: str):
     """Restart all processes or specific process with 'all' support."""
 
     async def _restart_all():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
-
-        try:
-            if name.lower() == "all":
-                result = await manager.restart_all()
-                if result.get("status") == "ok":
-                    click.echo("All processes restarted")
-                else:
-                    click.echo(f"Failed to restart all processes: {result}")
-            else:
-                result = await manager.restart_process(name)
-                if result.get("status") == "ok":
-                    click.echo(f"Process '{name}' restarted")
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
+
+            try:
+                if name.lower() == "all":
+                    result = await manager.restart_all()
+                    if result.get("status") == "ok":
+                        click.echo("All processes restarted")
+                    else:
+                        click.echo(f"Failed to restart all processes: {result}")
                 else:
-                    click.echo(f"Failed to restart process: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+                    result = await manager.restart_process(name)
+                    if result.get("status") == "ok":
+                        click.echo(f"Process '{name}' restarted")
+                    else:
+                        click.echo(f"Failed to restart process: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_restart_all())
+    _run(_restart_all())
 
 
 @cli.command()
@@ -385,43 +398,43 @@ def status_all():
     """Show status of all processes."""
 
     async def _status_all():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
-
-        try:
-            result = await manager.get_all_status()
-            if result.get("status") == "ok":
-                processes = result.get("processes", {})
-
-                click.echo("All Process Status:")
-                click.echo("-" * 50)
-
-                for name, status_info in processes.items():
-                    status = status_info.get("status", "unknown")
-                    if status == "active":
-                        status_color = click.style("RUNNING", fg="green")
-                    elif status == "stopped":
-                        status_color = click.style("STOPPED", fg="red")
-                    else:
-                        status_color = click.style(status.upper(), fg="yellow")
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
 
-                    click.echo(f"  {name:<20} {status_color}")
+            try:
+                result = await manager.get_all_status()
+                if result.get("status") == "ok":
+                    processes = result.get("processes", {})
+
+                    click.echo("All Process Status:")
+                    click.echo("-" * 50)
 
-                    # Show additional info if available
-                    if "info" in status_info:
-                        info = status_info["info"]
-                        if isinstance(info, dict):
-                            for key, value in info.items():
-                                if key not in ["status"]:
-                                    click.echo(f"    {key}: {value}")
-            else:
-                click.echo(f"Failed to get status: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+                    for name, status_info in processes.items():
+                        status = status_info.get("status", "unknown")
+                        if status == "active":
+                            status_color = click.style("RUNNING", fg="green")
+                        elif status == "stopped":
+                            status_color = click.style("STOPPED", fg="red")
+                        else:
+                            status_color = click.style(status.upper(), fg="yellow")
 
-    asyncio.run(_status_all())
+                        click.echo(f"  {name:<20} {status_color}")
+
+                        # Show additional info if available
+                        if "info" in status_info:
+                            info = status_info["info"]
+                            if isinstance(info, dict):
+                                for key, value in info.items():
+                                    if key not in ["status"]:
+                                        click.echo(f"    {key}: {value}")
+                else:
+                    click.echo(f"Failed to get status: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
+
+    _run(_status_all())
 
 
 @cli.command()
@@ -429,29 +442,29 @@ def stats():
     """Show system statistics."""
 
     async def _stats():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
-
-        try:
-            result = await manager.get_stats()
-            if result.get("status") == "ok":
-                click.echo("System Statistics:")
-                click.echo("-" * 30)
-
-                info = result.get("info", {})
-                if isinstance(info, dict):
-                    for key, value in info.items():
-                        click.echo(f"  {key}: {value}")
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
+
+            try:
+                result = await manager.get_stats()
+                if result.get("status") == "ok":
+                    click.echo("System Statistics:")
+                    click.echo("-" * 30)
+
+                    info = result.get("info", {})
+                    if isinstance(info, dict):
+                        for key, value in info.items():
+                            click.echo(f"  {key}: {value}")
+                    else:
+                        click.echo(f"  {info}")
                 else:
-                    click.echo(f"  {info}")
-            else:
-                click.echo(f"Failed to get stats: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+                    click.echo(f"Failed to get stats: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_stats())
+    _run(_stats())
 
 
 @cli.command()
@@ -459,60 +472,57 @@ def overview():
     """Show comprehensive system overview."""
 
     async def _overview():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
-
-        try:
-            # Get all status
-            status_result = await manager.get_all_status()
-
-            if status_result.get("status") == "ok":
-                processes = status_result.get("processes", {})
-
-                # Count processes by status
-                running_count = 0
-                stopped_count = 0
-                error_count = 0
-
-                for _name, status_info in processes.items():
-                    status = status_info.get("status", "unknown")
-                    if status == "active":
-                        running_count += 1
-                    elif status == "stopped":
-                        stopped_count += 1
-                    else:
-                        error_count += 1
-
-                # Display overview
-                click.echo("=== Circus Process Manager Overview ===")
-                click.echo(f"Total Processes: {len(processes)}")
-                click.echo(f"Running: {click.style(str(running_count), fg='green')}")
-                click.echo(f"Stopped: {click.style(str(stopped_count), fg='red')}")
-                if error_count > 0:
-                    click.echo(f"Errors: {click.style(str(error_count), fg='yellow')}")
-
-                click.echo("\nProcess Details:")
-                click.echo("-" * 40)
-
-                for name, status_info in processes.items():
-                    status = status_info.get("status", "unknown")
-                    if status == "active":
-                        status_display = click.style("●", fg="green") + " RUNNING"
-                    elif status == "stopped":
-                        status_display = click.style("●", fg="red") + " STOPPED"
-                    else:
-                        status_display = click.style("●", fg="yellow") + f" {status.upper()}"
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
 
-                    click.echo(f"  {name:<20} {status_display}")
-            else:
-                click.echo(f"Failed to get overview: {status_result}")
+            try:
+                # Get all status
+                status_result = await manager.get_all_status()
+
+                if status_result.get("status") == "ok":
+                    processes = status_result.get("processes", {})
+
+                    # Count processes by status and format their rows in one pass
+                    running_count = 0
+                    stopped_count = 0
+                    error_count = 0
+                    details = []
+
+                    for name, status_info in processes.items():
+                        status = status_info.get("status", "unknown")
+                        if status == "active":
+                            running_count += 1
+                            status_display = click.style("●", fg="green") + " RUNNING"
+                        elif status == "stopped":
+                            stopped_count += 1
+                            status_display = click.style("●", fg="red") + " STOPPED"
+                        else:
+                            error_count += 1
+                            status_display = click.style("●", fg="yellow") + f" {status.upper()}"
+
+                        details.append(f"  {name:<20} {status_display}")
+
+                    # Display overview
+                    click.echo("=== Circus Process Manager Overview ===")
+                    click.echo(f"Total Processes: {len(processes)}")
+                    click.echo(f"Running: {click.style(str(running_count), fg='green')}")
+                    click.echo(f"Stopped: {click.style(str(stopped_count), fg='red')}")
+                    if error_count > 0:
+                        click.echo(f"Errors: {click.style(str(error_count), fg='yellow')}")
+
+                    click.echo("\nProcess Details:")
+                    click.echo("-" * 40)
+                    if details:
+                        click.echo("\n".join(details))
+                else:
+                    click.echo(f"Failed to get overview: {status_result}")
 
-        except Exception as e:
-            click.echo(f"Error: {e}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_overview())
+    _run(_overview())
 
 
 @cli.command()
@@ -529,51 +539,51 @@ def logs(name: str, lines: int, stream: str):
     """Show process logs."""
 
     async def _logs():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
-
-        try:
-            if stream == "both":
-                result = await manager.get_process_logs(name, lines)
-                if result.get("status") == "ok":
-                    stdout_logs = result.get("stdout", [])
-                    stderr_logs = result.get("stderr", [])
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
 
-                    if stdout_logs:
-                        click.echo(f"=== STDOUT for {name} ===")
-                        for log_line in stdout_logs:
-                            click.echo(log_line)
+            try:
+                if stream == "both":
+                    result = await manager.get_process_logs(name, lines)
+                    if result.get("status") == "ok":
+                        stdout_logs = result.get("stdout", [])
+                        stderr_logs = result.get("stderr", [])
 
-                    if stderr_logs:
-                        click.echo(f"\n=== STDERR for {name} ===")
-                        for log_line in stderr_logs:
-                            click.echo(click.style(log_line, fg="red"))
+                        if stdout_logs:
+                            click.echo(f"=== STDOUT for {name} ===")
+                            for log_line in stdout_logs:
+                                click.echo(log_line)
 
-                    if not stdout_logs and not stderr_logs:
-                        click.echo(f"No logs found for process '{name}'")
-                else:
-                    click.echo(f"Failed to get logs: {result}")
-            else:
-                result = await manager.tail_process_logs(name, stream)
-                if result.get("status") == "ok":
-                    logs_data = result.get("logs", [])
-                    if logs_data:
-                        click.echo(f"=== {stream.upper()} for {name} ===")
-                        for log_line in logs_data:
-                            if stream == "stderr":
+                        if stderr_logs:
+                            click.echo(f"\n=== STDERR for {name} ===")
+                            for log_line in stderr_logs:
                                 click.echo(click.style(log_line, fg="red"))
-                            else:
-                                click.echo(log_line)
+
+                        if not stdout_logs and not stderr_logs:
+                            click.echo(f"No logs found for process '{name}'")
                     else:
-                        click.echo(f"No {stream} logs found for process '{name}'")
+                        click.echo(f"Failed to get logs: {result}")
                 else:
-                    click.echo(f"Failed to get logs: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+                    result = await manager.tail_process_logs(name, stream, lines)
+                    if result.get("status") == "ok":
+                        logs_data = result.get("logs", [])
+                        if logs_data:
+                            click.echo(f"=== {stream.upper()} for {name} ===")
+                            for log_line in logs_data:
+                                if stream == "stderr":
+                                    click.echo(click.style(log_line, fg="red"))
+                                else:
+                                    click.echo(log_line)
+                        else:
+                            click.echo(f"No {stream} logs found for process '{name}'")
+                    else:
+                        click.echo(f"Failed to get logs: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_logs())
+    _run(_logs())
 
 
 @cli.command()
@@ -589,30 +599,30 @@ def tail(name: str, stream: str):
     """Tail process logs (show recent logs)."""
 
     async def _tail():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
-
-        try:
-            result = await manager.tail_process_logs(name, stream)
-            if result.get("status") == "ok":
-                logs_data = result.get("logs", [])
-                if logs_data:
-                    click.echo(f"=== Tail {stream.upper()} for {name} ===")
-                    for log_line in logs_data:
-                        if stream == "stderr":
-                            click.echo(click.style(log_line, fg="red"))
-                        else:
-                            click.echo(log_line)
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
+                return
+
+            try:
+                result = await manager.tail_process_logs(name, stream)
+                if result.get("status") == "ok":
+                    logs_data = result.get("logs", [])
+                    if logs_data:
+                        click.echo(f"=== Tail {stream.upper()} for {name} ===")
+                        for log_line in logs_data:
+                            if stream == "stderr":
+                                click.echo(click.style(log_line, fg="red"))
+                            else:
+                                click.echo(log_line)
+                    else:
+                        click.echo(f"No recent {stream} logs found for process '{name}'")
                 else:
-                    click.echo(f"No recent {stream} logs found for process '{name}'")
-            else:
-                click.echo(f"Failed to tail logs: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+                    click.echo(f"Failed to tail logs: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_tail())
+    _run(_tail())
 
 
 @cli.command()
@@ -620,42 +630,43 @@ def logs_all():
     """Show recent logs for all processes."""
 
     async def _logs_all():
-        manager = CircusManager()
-        if not await manager.connect():
-            click.echo("Failed to connect to Circus daemon")
-            return
-
-        try:
-            # Get list of processes first
-            list_result = await manager.list_processes()
-            if list_result.get("status") != "ok":
-                click.echo("Failed to get process list")
+        async with CircusManager() as manager:
+            if not await manager.connect():
+                click.echo("Failed to connect to Circus daemon")
                 return
 
-            watchers = list_result.get("watchers", [])
-
-            for watcher in watchers:
-                if watcher in ["circusd-stats"]:  # Skip system processes
-                    continue
-
-                click.echo(f"\n{'=' * 60}")
-                click.echo(f"LOGS FOR: {watcher}")
-                click.echo("=" * 60)
-
-                result = await manager.tail_process_logs(watcher, "stdout")
-                if result.get("status") == "ok":
-                    logs_data = result.get("logs", [])
-                    if logs_data:
-                        for log_line in logs_data[-10:]:  # Show last 10 lines
-                            click.echo(log_line)
+            try:
+                # Get list of processes first
+                list_result = await manager.list_processes()
+                if list_result.get("status") != "ok":
+                    click.echo("Failed to get process list")
+                    return
+
+                watchers = list_result.get("watchers", [])
+
+                for watcher in watchers:
+                    if watcher in ["circusd-stats"]:  # Skip system processes
+                        continue
+
+                    click.echo(f"\n{'=' * 60}")
+                    click.echo(f"LOGS FOR: {watcher}")
+                    click.echo("=" * 60)
+
+                    # Only request the lines we show
+                    result = await manager.tail_process_logs(watcher, "stdout", lines=10)
+                    if result.get("status") == "ok":
+                        logs_data = result.get("logs", [])
+                        if logs_data:
+                            for log_line in logs_data:
+                                click.echo(log_line)
+                        else:
+                            click.echo("No recent logs")
                     else:
-                        click.echo("No recent logs")
-                else:
-                    click.echo(f"Failed to get logs: {result}")
-        except Exception as e:
-            click.echo(f"Error: {e}")
+                        click.echo(f"Failed to get logs: {result}")
+            except Exception as e:
+                click.echo(f"Error: {e}")
 
-    asyncio.run(_logs_all())
+    _run(_logs_all())
 
 
 @cli.command()
@@ -668,7 +679,7 @@ def mcp():
         server = CircusMCPServer()
         await server.run()
 
-    asyncio.run(_mcp())
+    _run(_mcp())
 
 
 if __name__ == "__main__":
@@ -6,10 +6,15 @@ import asyncio
 import os
 import signal
 import subprocess
-from typing import Any
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
 from circus.client import CircusClient
 
+T = TypeVar("T")
+
 
 class CircusManager:
     """Simple Circus process manager."""
@@ -20,17 +25,65 @@ class CircusManager:
         self.config_file = config_file
         self.client: CircusClient | None = None
         self.daemon_process: subprocess.Popen | None = None
+        # ZMQ sockets are not thread-safe, so every RPC runs on one dedicated thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="circus-rpc")
 
     async def connect(self) -> bool:
         """Connect to Circus daemon."""
+        client = None
         try:
-            self.client = CircusClient(endpoint=self.endpoint)
-            # Test connection
-            await asyncio.to_thread(self.client.call, {"command": "list"})
-            return True
+            client = CircusClient(endpoint=self.endpoint)
+            # Test connection before publishing the client to concurrent callers
+            await self._run_rpc(client.call, {"command": "list"})
         except Exception:
+            if client is not None:
+                await self._run_rpc(client.stop)
             return False
 
+        # Retire the previous client only once its replacement has answered
+        old_client, self.client = self.client, client
+        if old_client is not None:
+            await self._run_rpc(old_client.stop)
+        return True
+
+    async def _run_rpc(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking client operation on the RPC thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _call(self, cmd: dict[str, Any]) -> dict[str, Any]:
+        """Send a command to Circus on the RPC thread."""
+        client = self.client
+        if not client:
+            raise RuntimeError("Not connected to Circus")
+
+        try:
+            return await self._run_rpc(client.call, cmd)
+        except Exception:
+            # The DEALER socket queues requests while circusd is down, so drop it
+            # (LINGER=0 discards the request) rather than deliver it on restart
+            if self.client is client:
+                await self.close()
+            raise
+
+    async def close(self) -> None:
+        """Close the Circus client socket, if any."""
+        client, self.client = self.client, None
+        if client is not None:
+            # Stop on the RPC thread so the socket is closed behind in-flight calls
+            await self._run_rpc(client.stop)
+
+    async def aclose(self) -> None:
+        """Close the Circus client and shut down the RPC thread."""
+        await self.close()
+        self._executor.shutdown()
+
+    async def __aenter__(self) -> "CircusManager":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
     async def add_process(self, name: str, command: str, **kwargs) -> dict[str, Any]:
         """Add a new process to Circus."""
         if not self.client:
@@ -38,7 +91,7 @@ class CircusManager:
 
         cmd = {"command": "add", "properties": {"name": name, "cmd": command, **kwargs}}
 
-        result = await asyncio.to_thread(self.client.call, cmd)
+        result = await self._call(cmd)
         return result
 
     async def start_process(self, name: str) -> dict[str, Any]:
@@ -47,7 +100,7 @@ class CircusManager:
             raise RuntimeError("Not connected to Circus")
 
         cmd = {"command": "start", "properties": {"name": name}}
-        result = await asyncio.to_thread(self.client.call, cmd)
+        result = await self._call(cmd)
         return result
 
     async def stop_process(self, name: str) -> dict[str, Any]:
@@ -56,7 +109,7 @@ class CircusManager:
             raise RuntimeError("Not connected to Circus")
 
         cmd = {"command": "stop", "properties": {"name": name}}
-        result = await asyncio.to_thread(self.client.call, cmd)
+        result = await self._call(cmd)
         return result
 
     async def list_processes(self) -> dict[str, Any]:
@@ -65,7 +118,7 @@ class CircusManager:
             raise RuntimeError("Not connected to Circus")
 
         cmd = {"command": "list"}
-        result = await asyncio.to_thread(self.client.call, cmd)
+        result = await self._call(cmd)
         return result
 
     async def get_process_status(self, name: str) -> dict[str, Any]:
@@ -74,7 +127,7 @@ class CircusManager:
             raise RuntimeError("Not connected to Circus")
 
         cmd = {"command": "status", "properties": {"name": name}}
-        result = await asyncio.to_thread(self.client.call, cmd)
+        result = await self._call(cmd)
         return result
 
     async def restart_process(self, name: str) -> dict[str, Any]:
@@ -83,7 +136,7 @@ class CircusManager:
             raise RuntimeError("Not connected to Circus")
 
         cmd = {"command": "restart", "properties": {"name": name}}
-        result = await asyncio.to_thread(self.client.call, cmd)
+        result = await self._call(cmd)
         return result
 
     async def remove_process(self, name: str) -> dict[str, Any]:
@@ -92,7 +145,7 @@ class CircusManager:
             raise RuntimeError("Not connected to Circus")
 
         cmd = {"command": "rm", "properties": {"name": name}}
-        result = await asyncio.to_thread(self.client.call, cmd)
+        result = await self._call(cmd)
         return result
 
     async def ensure_started(self, name: str) -> dict[str, Any]:
@@ -102,7 +155,7 @@ class CircusManager:
 
         # Check current status first
         status_cmd = {"command": "status", "properties": {"name": name}}
-        status_result = await asyncio.to_thread(self.client.call, status_cmd)
+        status_result = await self._call(status_cmd)
 
         if status_result.get("status") == "active":
             return {"status": "ok", "message": f"Process '{name}' is already running"}
@@ -117,7 +170,7 @@ class CircusManager:
 
         # Check current status first
         status_cmd = {"command": "status", "properties": {"name": name}}
-        status_result = await asyncio.to_thread(self.client.call, status_cmd)
+        status_result = await self._call(status_cmd)
 
         if status_result.get("status") == "stopped":
             return {"status": "ok", "message": f"Process '{name}' is already stopped"}
@@ -131,7 +184,7 @@ class CircusManager:
             raise RuntimeError("Not connected to Circus")
 
         cmd = {"command": "start"}
-        result = await asyncio.to_thread(self.client.call, cmd)
+        result = await self._call(cmd)
         return result
 
     async def stop_all(self) -> dict[str, Any]:
@@ -140,7 +193,7 @@ class CircusManager:
             raise RuntimeError("Not connected to Circus")
 
         cmd = {"command": "stop"}
-        result = await asyncio.to_thread(self.client.call, cmd)
+        result = await self._call(cmd)
         return result
 
     async def restart_all(self) -> dict[str, Any]:
@@ -149,7 +202,7 @@ class CircusManager:
             raise RuntimeError("Not connected to Circus")
 
         cmd = {"command": "restart"}
-        result = await asyncio.to_thread(self.client.call, cmd)
+        result = await self._call(cmd)
         return result
 
     async def get_all_status(self) -> dict[str, Any]:
@@ -157,22 +210,13 @@ class CircusManager:
         if not self.client:
             raise RuntimeError("Not connected to Circus")
 
-        # First get list of all processes
-        list_result = await self.list_processes()
-        if list_result.get("status") != "ok":
-            return list_result
-
-        watchers = list_result.get("watchers", [])
-        status_info = {}
+        # Without a name, Circus returns every watcher's status in one round-trip
+        result = await self._call({"command": "status"})
+        if result.get("status") != "ok":
+            return result
 
-        # Get status for each process
-        for watcher in watchers:
-            try:
-                status_cmd = {"command": "status", "properties": {"name": watcher}}
-                status_result = await asyncio.to_thread(self.client.call, status_cmd)
-                status_info[watcher] = status_result
-            except Exception as e:
-                status_info[watcher] = {"status": "error", "message": str(e)}
+        statuses = result.get("statuses", {})
+        status_info = {watcher: {"status": statuses[watcher]} for watcher in sorted(statuses)}
 
         return {"status": "ok", "processes": status_info}
 
@@ -182,7 +226,7 @@ class CircusManager:
             raise RuntimeError("Not connected to Circus")
 
         cmd = {"command": "stats"}
-        result = await asyncio.to_thread(self.client.call, cmd)
+        result = await self._call(cmd)
         return result
 
     async def get_process_logs(self, name: str, lines: int = 100) -> dict[str, Any]:
@@ -197,14 +241,14 @@ class CircusManager:
         }
 
         try:
-            stdout_result = await asyncio.to_thread(self.client.call, stdout_cmd)
+            stdout_result = await self._call(stdout_cmd)
 
             # Get stderr logs
             stderr_cmd = {
                 "command": "logs",
                 "properties": {"name": name, "stream": "stderr", "lines": lines},
             }
-            stderr_result = await asyncio.to_thread(self.client.call, stderr_cmd)
+            stderr_result = await self._call(stderr_cmd)
 
             return {
                 "status": "ok",
@@ -215,7 +259,9 @@ class CircusManager:
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
-    async def tail_process_logs(self, name: str, stream: str = "stdout") -> dict[str, Any]:
+    async def tail_process_logs(
+        self, name: str, stream: str = "stdout", lines: int = 50
+    ) -> dict[str, Any]:
         """Tail process logs (get recent logs)."""
         if not self.client:
             raise RuntimeError("Not connected to Circus")
@@ -225,12 +271,12 @@ class CircusManager:
             "properties": {
                 "name": name,
                 "stream": stream,
-                "lines": 50,  # Get last 50 lines
+                "lines": lines,
             },
         }
 
         try:
-            result = await asyncio.to_thread(self.client.call, cmd)
+            result = await self._call(cmd)
             return {
                 "status": "ok",
                 "process": name,
@@ -240,13 +286,15 @@ class CircusManager:
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
-    def start_daemon(self, config_file: str | None = None) -> bool:
-        """Start Circus daemon."""
+    def start_daemon(
+        self, config_file: str | None = None, check_running: bool = True, timeout: float = 7.0
+    ) -> bool:
+        """Start Circus daemon, waiting up to ``timeout`` seconds for it to answer."""
         config = config_file or self.config_file
 
         try:
-            # Check if daemon is already running
-            if self.is_daemon_running():
+            # Check if daemon is already running (callers that just probed can skip this)
+            if check_running and self.is_daemon_running():
                 return True
 
             # Start daemon
@@ -257,12 +305,17 @@ class CircusManager:
                 preexec_fn=os.setsid if hasattr(os, "setsid") else None,
             )
 
-            # Wait a bit for daemon to start
-            import time
+            # Poll until the daemon answers instead of sleeping a fixed time
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                if self.daemon_process.poll() is not None:
+                    return False
+                if self.is_daemon_running(timeout=0.2):
+                    return True
+                # Back off so a probe that fails immediately does not spin
+                time.sleep(0.1)
 
-            time.sleep(2)
-
-            return self.is_daemon_running()
+            return False
         except Exception:
             return False
 
@@ -298,12 +351,16 @@ class CircusManager:
         except Exception:
             return False
 
-    def is_daemon_running(self) -> bool:
+    def is_daemon_running(self, timeout: float = 5.0) -> bool:
         """Check if Circus daemon is running."""
+        temp_client = None
         try:
             # Try to connect to check if daemon is running
-            temp_client = CircusClient(endpoint=self.endpoint)
+            temp_client = CircusClient(endpoint=self.endpoint, timeout=timeout)
             temp_client.call({"command": "list"})
             return True
         except Exception:
             return False
+        finally:
+            if temp_client is not None:
+                temp_client.stop()
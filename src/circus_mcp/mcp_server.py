@@ -2,6 +2,8 @@
 MCP Server for Circus process management.
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from mcp.server import Server
@@ -10,6 +12,69 @@ from mcp.types import TextContent, Tool
 
 from .manager import CircusManager
 
+# Tool definitions are static, so build them once instead of on every tools/list
+TOOLS: list[Tool] = [
+    Tool(
+        name="add_process",
+        description="Add a new process to Circus",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Process name"},
+                "command": {"type": "string", "description": "Command to run"},
+                "numprocesses": {
+                    "type": "integer",
+                    "default": 1,
+                    "description": "Number of processes",
+                },
+                "working_dir": {"type": "string", "description": "Working directory"},
+            },
+            "required": ["name", "command"],
+        },
+    ),
+    Tool(
+        name="start_process",
+        description="Start a process",
+        inputSchema={
+            "type": "object",
+            "properties": {"name": {"type": "string", "description": "Process name"}},
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="stop_process",
+        description="Stop a process",
+        inputSchema={
+            "type": "object",
+            "properties": {"name": {"type": "string", "description": "Process name"}},
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="restart_process",
+        description="Restart a process",
+        inputSchema={
+            "type": "object",
+            "properties": {"name": {"type": "string", "description": "Process name"}},
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="list_processes",
+        description="List all processes",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="get_process_status",
+        description="Get process status",
+        inputSchema={
+            "type": "object",
+            "properties": {"name": {"type": "string", "description": "Process name"}},
+            "required": ["name"],
+        },
+    ),
+]
+
 
 class CircusMCPServer:
     """MCP Server for Circus process management."""
@@ -17,105 +82,47 @@ class CircusMCPServer:
     def __init__(self):
         self.server = Server("circus-mcp")
         self.manager = CircusManager()
+        # Tool name -> handler, so dispatch is one dict lookup instead of an if/elif chain
+        self._tool_handlers: dict[str, Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]] = {
+            "add_process": self._add_process,
+            "start_process": lambda args: self.manager.start_process(args["name"]),
+            "stop_process": lambda args: self.manager.stop_process(args["name"]),
+            "restart_process": lambda args: self.manager.restart_process(args["name"]),
+            "list_processes": lambda args: self.manager.list_processes(),
+            "get_process_status": lambda args: self.manager.get_process_status(args["name"]),
+        }
         self._setup_tools()
 
+    async def _add_process(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the add_process tool."""
+        return await self.manager.add_process(
+            arguments["name"],
+            arguments["command"],
+            numprocesses=arguments.get("numprocesses", 1),
+            working_dir=arguments.get("working_dir"),
+        )
+
     def _setup_tools(self):
         """Setup MCP tools."""
 
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
             """List available tools."""
-            return [
-                Tool(
-                    name="add_process",
-                    description="Add a new process to Circus",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string", "description": "Process name"},
-                            "command": {"type": "string", "description": "Command to run"},
-                            "numprocesses": {
-                                "type": "integer",
-                                "default": 1,
-                                "description": "Number of processes",
-                            },
-                            "working_dir": {"type": "string", "description": "Working directory"},
-                        },
-                        "required": ["name", "command"],
-                    },
-                ),
-                Tool(
-                    name="start_process",
-                    description="Start a process",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {"name": {"type": "string", "description": "Process name"}},
-                        "required": ["name"],
-                    },
-                ),
-                Tool(
-                    name="stop_process",
-                    description="Stop a process",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {"name": {"type": "string", "description": "Process name"}},
-                        "required": ["name"],
-                    },
-                ),
-                Tool(
-                    name="restart_process",
-                    description="Restart a process",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {"name": {"type": "string", "description": "Process name"}},
-                        "required": ["name"],
-                    },
-                ),
-                Tool(
-                    name="list_processes",
-                    description="List all processes",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                Tool(
-                    name="get_process_status",
-                    description="Get process status",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {"name": {"type": "string", "description": "Process name"}},
-                        "required": ["name"],
-                    },
-                ),
-            ]
+            return TOOLS
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             """Handle tool calls."""
+            handler = self._tool_handlers.get(name)
+            if handler is None:
+                return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
-            # Ensure connection
-            if not await self.manager.connect():
+            # Connect on first use; later calls reuse the same client
+            if self.manager.client is None and not await self.manager.connect():
                 return [TextContent(type="text", text="Failed to connect to Circus daemon")]
 
             try:
-                if name == "add_process":
-                    result = await self.manager.add_process(
-                        arguments["name"],
-                        arguments["command"],
-                        numprocesses=arguments.get("numprocesses", 1),
-                        working_dir=arguments.get("working_dir"),
-                    )
-                elif name == "start_process":
-                    result = await self.manager.start_process(arguments["name"])
-                elif name == "stop_process":
-                    result = await self.manager.stop_process(arguments["name"])
-                elif name == "restart_process":
-                    result = await self.manager.restart_process(arguments["name"])
-                elif name == "list_processes":
-                    result = await self.manager.list_processes()
-                elif name == "get_process_status":
-                    result = await self.manager.get_process_status(arguments["name"])
-                else:
-                    return [TextContent(type="text", text=f"Unknown tool: {name}")]
-
+                result = await handler(arguments)
                 return [TextContent(type="text", text=str(result))]
 
             except Exception as e:
@@ -123,7 +130,14 @@ class CircusMCPServer:
 
     async def run(self):
         """Run the MCP server."""
-        async with stdio_server() as streams:
-            await self.server.run(
-                streams[0], streams[1], self.server.create_initialization_options()
-            )
+        if hasattr(asyncio, "eager_task_factory"):
+            # Python 3.12+: let request handlers run inline until they first block
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+        try:
+            async with stdio_server() as streams:
+                await self.server.run(
+                    streams[0], streams[1], self.server.create_initialization_options()
+                )
+        finally:
+            await self.manager.aclose()
@@ -4,14 +4,27 @@ Test CircusMCP tools and functionality
 """
 
 import asyncio
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams
 
 from circus_mcp.manager import CircusManager
 from circus_mcp.mcp_server import CircusMCPServer
 
 
+async def _call_tool(mcp_server, name, arguments):
+    """Invoke a tool through the server's registered tools/call handler"""
+    handler = mcp_server.server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments)
+    )
+    result = await handler(request)
+    return result.root.content[0].text
+
+
 class TestCircusManager:
     """Test CircusManager functionality"""
 
@@ -32,27 +45,22 @@ class TestCircusManager:
         # Import the module to ensure we're patching the right location
         import circus_mcp.manager as manager_module
 
-        # Create a mock client
+        # Create a mock client that answers the connection probe
         mock_client = Mock()
+        mock_client.call.return_value = {"status": "ok"}
 
-        # Mock the CircusClient class and asyncio.to_thread function
+        # Mock the CircusClient class
         with patch.object(
             manager_module, "CircusClient", return_value=mock_client
         ) as mock_client_class:
-            with patch.object(manager_module, "asyncio") as mock_asyncio:
-                # Set up the asyncio.to_thread mock to return a coroutine
-                async def mock_to_thread(func, *args, **kwargs):
-                    return {"status": "ok"}
-
-                mock_asyncio.to_thread = mock_to_thread
-
-                # Call the connect method
-                result = await manager.connect()
+            # Call the connect method
+            result = await manager.connect()
 
-                # Verify the results
-                assert result is True
-                assert manager.client is mock_client
-                mock_client_class.assert_called_once_with(endpoint="tcp://127.0.0.1:5555")
+            # Verify the results
+            assert result is True
+            assert manager.client is mock_client
+            mock_client_class.assert_called_once_with(endpoint="tcp://127.0.0.1:5555")
+            mock_client.call.assert_called_once_with({"command": "list"})
 
     @pytest.mark.asyncio
     async def test_connect_failure(self, manager):
@@ -64,6 +72,113 @@ class TestCircusManager:
             assert result is False
             assert manager.client is None
 
+    @pytest.mark.asyncio
+    async def test_connect_probe_failure_resets_client(self, manager):
+        """Test a failed connection probe does not leave a client behind"""
+        with patch("circus_mcp.manager.CircusClient") as mock_client_class:
+            mock_client_class.return_value.call.side_effect = Exception("Timed out.")
+            result = await manager.connect()
+
+        assert result is False
+        assert manager.client is None
+        mock_client_class.return_value.stop.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_keeps_old_client_until_probe_succeeds(self, manager):
+        """Test reconnecting only retires the old client once the new one answers"""
+        old_client = Mock()
+        manager.client = old_client
+
+        with patch("circus_mcp.manager.CircusClient") as mock_client_class:
+            mock_client_class.return_value.call.side_effect = Exception("Timed out.")
+            assert await manager.connect() is False
+            assert manager.client is old_client
+            old_client.stop.assert_not_called()
+
+            mock_client_class.return_value.call.side_effect = None
+            mock_client_class.return_value.call.return_value = {"status": "ok"}
+            assert await manager.connect() is True
+
+        assert manager.client is mock_client_class.return_value
+        old_client.stop.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_aclose_stops_client_on_rpc_thread(self, manager):
+        """Test closing stops the socket on the RPC thread and shuts that thread down"""
+        stop_threads = []
+        manager.client = Mock()
+        manager.client.stop.side_effect = lambda: stop_threads.append(
+            threading.current_thread().name
+        )
+
+        await manager.aclose()
+
+        assert manager.client is None
+        assert len(stop_threads) == 1
+        assert stop_threads[0].startswith("circus-rpc")
+        with pytest.raises(RuntimeError):
+            manager._executor.submit(time.time)
+
+    def test_is_daemon_running_closes_probe_client(self, manager):
+        """Test the daemon probe closes its temporary socket"""
+        with patch("circus_mcp.manager.CircusClient") as mock_client_class:
+            mock_client_class.return_value.call.return_value = {"status": "ok"}
+
+            assert manager.is_daemon_running() is True
+            mock_client_class.return_value.stop.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_all_status_single_request(self, manager):
+        """Test all statuses are fetched with one Circus request"""
+        manager.client = Mock()
+        manager.client.call.return_value = {
+            "status": "ok",
+            "statuses": {"worker": "stopped", "api": "active"},
+        }
+
+        result = await manager.get_all_status()
+
+        manager.client.call.assert_called_once_with({"command": "status"})
+        assert result == {
+            "status": "ok",
+            "processes": {"api": {"status": "active"}, "worker": {"status": "stopped"}},
+        }
+
+    def test_start_daemon_returns_once_ready(self, manager):
+        """Test start_daemon returns as soon as the daemon answers"""
+        with (
+            patch("circus_mcp.manager.subprocess.Popen") as mock_popen,
+            patch.object(manager, "is_daemon_running", side_effect=[False, True]) as mock_probe,
+        ):
+            mock_popen.return_value.poll.return_value = None
+
+            assert manager.start_daemon(check_running=False) is True
+            assert mock_probe.call_count == 2
+
+    def test_start_daemon_fails_when_process_exits(self, manager):
+        """Test start_daemon stops waiting once circusd has exited"""
+        with (
+            patch("circus_mcp.manager.subprocess.Popen") as mock_popen,
+            patch.object(manager, "is_daemon_running") as mock_probe,
+        ):
+            mock_popen.return_value.poll.return_value = 1
+
+            assert manager.start_daemon(check_running=False) is False
+            mock_probe.assert_not_called()
+
+    def test_start_daemon_times_out(self, manager):
+        """Test start_daemon gives up after its timeout without busy-looping"""
+        with (
+            patch("circus_mcp.manager.subprocess.Popen") as mock_popen,
+            patch.object(manager, "is_daemon_running", return_value=False) as mock_probe,
+        ):
+            mock_popen.return_value.poll.return_value = None
+
+            started = time.monotonic()
+            assert manager.start_daemon(check_running=False, timeout=0.3) is False
+            assert time.monotonic() - started >= 0.3
+            assert mock_probe.call_count <= 4
+
 
 class TestCircusMCPServer:
     """Test CircusMCPServer MCP integration"""
@@ -83,6 +198,92 @@ class TestCircusMCPServer:
         # Test that server has been properly initialized
         assert mcp_server.server.name == "circus-mcp"
 
+    @pytest.mark.asyncio
+    async def test_tool_dispatch(self, mcp_server):
+        """Test tool names map to the matching manager command"""
+        mcp_server.manager.client = Mock()
+        mcp_server.manager.client.call.return_value = {"status": "ok"}
+
+        result = await _call_tool(mcp_server, "start_process", {"name": "web"})
+
+        assert result == "{'status': 'ok'}"
+        mcp_server.manager.client.call.assert_called_once_with(
+            {"command": "start", "properties": {"name": "web"}}
+        )
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_does_not_connect(self, mcp_server):
+        """Test unknown tools are rejected before connecting to Circus"""
+        with patch.object(mcp_server.manager, "connect") as mock_connect:
+            result = await _call_tool(mcp_server, "no_such_tool", {})
+
+        assert result == "Unknown tool: no_such_tool"
+        mock_connect.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_reuse_connection(self, mcp_server):
+        """Test successive tool calls connect to Circus only once"""
+        manager = mcp_server.manager
+        with (
+            patch("circus_mcp.manager.CircusClient") as mock_client_class,
+            patch.object(manager, "connect", wraps=manager.connect) as mock_connect,
+        ):
+            mock_client_class.return_value.call.return_value = {"status": "ok"}
+
+            await _call_tool(mcp_server, "list_processes", {})
+            await _call_tool(mcp_server, "get_process_status", {"name": "web"})
+
+        mock_connect.assert_called_once()
+        mock_client_class.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_call_drops_client(self, mcp_server):
+        """Test a failed tool call discards the client so the next call reconnects"""
+        with patch("circus_mcp.manager.CircusClient") as mock_client_class:
+            mock_client = mock_client_class.return_value
+            mock_client.call.side_effect = [
+                {"status": "ok"},
+                Exception("Timed out."),
+                {"status": "ok"},
+                {"status": "active"},
+            ]
+
+            result = await _call_tool(mcp_server, "stop_process", {"name": "sleeper"})
+            assert result == "Error: Timed out."
+            assert mcp_server.manager.client is None
+            mock_client.stop.assert_called_once()
+
+            result = await _call_tool(mcp_server, "get_process_status", {"name": "sleeper"})
+
+        assert result == "{'status': 'active'}"
+        assert mock_client_class.call_count == 2
+        assert mock_client.call.call_args_list[2].args[0]["command"] == "list"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_wait_for_probe(self, mcp_server):
+        """Test a call arriving during the connection probe never uses the unverified client"""
+
+        def make_client(**kwargs):
+            client = Mock()
+
+            def call(cmd):
+                if client.stop.called:
+                    raise Exception("Socket operation on non-socket")
+                time.sleep(0.05)
+                raise Exception("Timed out.")
+
+            client.call.side_effect = call
+            return client
+
+        with patch("circus_mcp.manager.CircusClient", side_effect=make_client):
+            results = await asyncio.gather(
+                _call_tool(mcp_server, "list_processes", {}),
+                _call_tool(mcp_server, "list_processes", {}),
+            )
+
+        assert results == ["Failed to connect to Circus daemon"] * 2
+        assert mcp_server.manager.client is None
+
 
 class TestIntegration:
     """Integration tests for full workflow"""
@@ -99,26 +300,24 @@ class TestIntegration:
             "stop": {"status": "ok", "process": "test"},
         }
 
-        with patch("asyncio.to_thread") as mock_thread:
-            mock_thread.side_effect = lambda func, cmd: mock_responses.get(
-                cmd["command"], {"status": "ok"}
-            )
-
-            manager = CircusManager()
-            manager.client = Mock()  # Mock client connection
+        manager = CircusManager()
+        manager.client = Mock()  # Mock client connection
+        manager.client.call.side_effect = lambda cmd: mock_responses.get(
+            cmd["command"], {"status": "ok"}
+        )
 
-            # Test process lifecycle
-            add_result = await manager.add_process("test", "echo hello")
-            assert add_result["status"] == "ok"
+        # Test process lifecycle
+        add_result = await manager.add_process("test", "echo hello")
+        assert add_result["status"] == "ok"
 
-            start_result = await manager.start_process("test")
-            assert start_result["status"] == "ok"
+        start_result = await manager.start_process("test")
+        assert start_result["status"] == "ok"
 
-            status_result = await manager.get_process_status("test")
-            assert status_result["status"] == "running"
+        status_result = await manager.get_process_status("test")
+        assert status_result["status"] == "running"
 
-            stop_result = await manager.stop_process("test")
-            assert stop_result["status"] == "ok"
+        stop_result = await manager.stop_process("test")
+        assert stop_result["status"] == "ok"
 
 
 @pytest.mark.asyncio